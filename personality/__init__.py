@@ -6,4 +6,5 @@ __version__ = "0.1.0"
 # from .Person import Person
 # from .Persona import Persona
 from .create import Person
-from .create import Persona
\ No newline at end of file
+from .create import Persona
+from .cache import LLMCache
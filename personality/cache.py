@@ -0,0 +1,125 @@
+import json
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class LLMCache:
+    """
+    An in-memory, least-recently-used cache of LLM responses keyed on the full request payload.
+
+    Share one instance between personas (or pass it to a Person) to skip the API round trip
+    whenever an identical request has already been answered.
+
+    Attributes:
+        maxsize (int): Maximum number of responses kept before the least recently used one is evicted.
+    """
+
+    def __init__(self, maxsize = 1024):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of cached responses. Default is 1024.
+        """
+        self.maxsize = maxsize
+        self._store = OrderedDict()
+        self._lock = threading.Lock()   # personas respond from worker threads
+        self._inflight = {}             # (event loop, key) -> task of an async request not yet answered
+
+
+    @staticmethod
+    def cache_key(model, messages, temperature, seed, max_tokens = None):
+        """
+        Builds the cache key for a chat completion request.
+
+        Args:
+            model (str): The model name.
+            messages (list): The messages sent to the model.
+            temperature (float): The sampling temperature.
+            seed (int): The sampling seed.
+            max_tokens (int, optional): The completion length limit.
+
+        Returns:
+            str: SHA-256 hex digest of the canonical request, or None if the request is
+                 nondeterministic (temperature above 0 without a seed) and must not be cached.
+        """
+        if temperature > 0 and seed is None:
+            return None
+        payload = json.dumps({'model': model, 'messages': messages, 'temperature': temperature,
+                              'seed': seed, 'max_tokens': max_tokens},
+                             sort_keys = True, ensure_ascii = False, default = str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+    def get(self, key):
+        """
+        Returns the cached response for `key`, or None on a miss.
+        """
+        with self._lock:
+            if key not in self._store:
+                return None
+            self._store.move_to_end(key)
+            return self._store[key]
+
+
+    def set(self, key, value):
+        """
+        Stores `value` under `key`, evicting the least recently used entry if the cache is full.
+        """
+        with self._lock:
+            self._store[key] = value
+            self._store.move_to_end(key)
+            if len(self._store) > self.maxsize:
+                self._store.popitem(last = False)
+
+
+    async def coalesce(self, key, fetch):
+        """
+        Awaits `fetch()` once for all concurrent callers with the same `key` and caches the result.
+
+        Callers arriving while an identical request is still in flight share its result instead of
+        sending a duplicate request; a cancelled caller does not cancel the shared request. Requests
+        are only shared within one event loop, so threads each running their own loop (e.g. via
+        `asyncio.run`) can use the same cache.
+
+        Args:
+            key (str): Cache key of the request.
+            fetch: Zero-argument callable returning a coroutine that performs the request.
+
+        Returns:
+            The response produced by `fetch()`.
+        """
+        # a task can only be awaited from the loop that runs it
+        inflight_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._inflight.get(inflight_key)
+            if task is None:
+                task = asyncio.ensure_future(fetch())
+                self._inflight[inflight_key] = task
+                task.add_done_callback(lambda _: self._forget(inflight_key))
+        result = await asyncio.shield(task)
+        if result is not None:
+            self.set(key, result)
+        return result
+
+
+    def _forget(self, inflight_key):
+        """
+        Drops a finished in-flight request.
+        """
+        with self._lock:
+            self._inflight.pop(inflight_key, None)
+
+
+    def clear(self):
+        """
+        Removes every cached response.
+        """
+        with self._lock:
+            self._store.clear()
+
+
+    def __len__(self):
+        return len(self._store)
@@ -1,7 +1,36 @@
-import re
 import random
+import json
+import asyncio
+import threading
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 #from tenacity import (retry, stop_after_attempt, wait_fixed)
 
+# referee instruction appended after the conversation; only the choices between prefix and suffix vary between calls
+_REF_PREFIX = "CHOOSE A RESPONSE:```"
+_REF_SUFFIX = "```."
+
+
+class _RequestParam:
+  """
+  A Persona attribute stored in its precomputed request kwargs, so updates (e.g. a temperature sweep) reach the next call.
+  """
+
+  def __set_name__(self, owner, name):
+    self.name = name
+
+  def __get__(self, instance, owner = None):
+    if instance is None:
+      return self
+    try:
+      return instance._static_kwargs[self.name]
+    except KeyError:
+      raise AttributeError(self.name) from None
+
+  def __set__(self, instance, value):
+    instance._static_kwargs[self.name] = value
+
+
 class Persona:
   """
     A persona-based language model agent that interacts with an LLM API client
@@ -14,12 +43,19 @@ class Persona:
         sys_prompt (str): The system prompt guiding the agent's behavior.
         history_ (list): Chat history including system, user, and assistant messages.
         temperature (float): Temperature for randomness in responses.
-        seed (float): Seed value to make responses reproducible.
+        seed (int): Seed value to make responses reproducible.
         rp (float): Placeholder for top-p sampling (currently unused).
+        cache (LLMCache): Optional response cache shared across calls (None disables caching).
   """
 
+  __slots__ = ('client', 'persona', 'sys_prompt', '_sys_msg', 'history_', 'rp', 'cache', '_static_kwargs')
 
-  def __init__(self, client, model, persona = '', function = '', temp = 0.5, seed = random.random(), rp = 1.1):
+  # request settings live in `_static_kwargs`, which is passed straight to the client on every call
+  model = _RequestParam()
+  temperature = _RequestParam()
+  seed = _RequestParam()
+
+  def __init__(self, client, model, persona = '', function = '', temp = 0.5, seed = None, rp = 1.1, cache = None):
     """
      Initializes a Persona instance with a specific model, persona, and system prompt.
 
@@ -29,17 +65,21 @@ class Persona:
          persona (str, optional): Name or identity of the persona. Default is ''.
          function (str, optional): System prompt to set the behavior of the persona. Default is ''.
          temp (float, optional): Temperature for response variability. Default is 0.5.
-         seed (float, optional): Seed for deterministic generation. Default is random.random().
+         seed (int, optional): Seed for deterministic generation. Default is None, which draws a fresh random seed per instance.
          rp (float, optional): Placeholder for top-p sampling. Default is 1.1.
+         cache (LLMCache, optional): Cache consulted before each LLM call. Default is None (no caching).
      """
     self.client = client
+    self._static_kwargs = {}
     self.model = model
     self.persona = persona
     self.sys_prompt = function
-    self.history_ = [{'role':'system', 'content':self.sys_prompt}]
+    self._sys_msg = {'role':'system', 'content':self.sys_prompt}   # reused by every history reset
+    self.history_ = [self._sys_msg]
     self.temperature = temp
-    self.seed = round(seed)
+    self.seed = round(seed) if seed is not None else random.randint(0, 2**31 - 1)
     self.rp = rp
+    self.cache = cache
 
   # retry after 3 mins if token limit exceeded; stop retrying after 6 attempts
   # @retry(wait=wait_fixed(3*60), stop=stop_after_attempt(6))
@@ -60,7 +100,7 @@ class Persona:
     """
     
     # diff between list input and str input
-    if type(convo) == str:
+    if isinstance(convo, str):
         convo = [{'role':'user', 'content':convo}]
     # elif type(convo) == list:
     #   try:
@@ -70,25 +110,169 @@ class Persona:
     #   except:
     #     # RETURN EXCEPTION ERROR
 
-    if cdisplay == True:
+    if cdisplay:
       print(f"{self.persona} thinking...")
 
-    self.history_ += convo
+    # build the request without touching history_, so the system-prompt prefix stays identical across calls
+    messages = [*self.history_, *convo]
+    key = self._cache_key(messages, max_tokens)
+    agent_result = self.cache.get(key) if key is not None else None
+    if agent_result is None:
+      output = self.client.chat.completions.create(
+          messages = messages,
+          max_tokens = max_tokens,
+          **self._static_kwargs,   # model, temperature, seed
+          # top_p = self.rp
+      )
+      agent_result = output.choices[0].message.content
+      if key is not None:
+        self.cache.set(key, agent_result)
+
+    if cdisplay:
+      print(f"{self.persona} finished thinking!")
+
+    return agent_result
+
+
+  async def arespond(self, convo, max_tokens = 100, cdisplay = False):
+    """
+    Coroutine counterpart of `respond` for asynchronous LLM clients (e.g., AsyncOpenAI),
+    whose `chat.completions.create` must be awaited.
+
+    Args:
+        convo (list): List of messages in the format [{'role': 'user', 'content': '...'}, ...].
+        max_tokens (int, optional): Maximum number of tokens to generate. Default is 100.
+        cdisplay (bool, optional): If True, displays status messages during processing. Default is False.
+
+    Returns:
+        str: The generated response content from the LLM.
+    """
+    if isinstance(convo, str):
+        convo = [{'role':'user', 'content':convo}]
+
+    if cdisplay:
+      print(f"{self.persona} thinking...")
+
+    messages = [*self.history_, *convo]
+    key = self._cache_key(messages, max_tokens)
+    agent_result = self.cache.get(key) if key is not None else None
+    if agent_result is None:
+      if key is not None:
+        # identical requests already in flight are awaited instead of sent again
+        agent_result = await self.cache.coalesce(key, lambda: self._acomplete(messages, max_tokens))
+      else:
+        agent_result = await self._acomplete(messages, max_tokens)
+
+    if cdisplay:
+      print(f"{self.persona} finished thinking!")
+
+    return agent_result
+
+
+  async def _acomplete(self, messages, max_tokens):
+    """
+    Awaits one chat completion for `messages` and returns its content.
+    """
+    output = await self._acreate(
+        messages = messages,
+        max_tokens = max_tokens,
+        **self._static_kwargs,
+    )
+    return output.choices[0].message.content
+
+
+  def _acreate(self, **kwargs):
+    """
+    Starts a chat completion on an asynchronous client and returns the awaitable.
+
+    Raises:
+        TypeError: If the persona uses the default client, which is synchronous.
+    """
+    if isinstance(self.client, _DefaultClient):
+      raise TypeError(f"{self.persona or 'Persona'} uses the default OpenAI client, which is synchronous; "
+                      "pass an asynchronous client (e.g., AsyncOpenAI) to use the async methods.")
+    return self.client.chat.completions.create(**kwargs)
+
+
+  def respond_many(self, convo, n, max_tokens = 100, cdisplay = False):
+    """
+    Generates `n` independent responses to the same conversation in a single request (the API's `n` parameter).
+
+    Responses from a batched request are not cached. Servers that ignore `n` and return fewer
+    choices are topped up with one request per missing response.
+
+    Args:
+        convo (list): List of messages in the format [{'role': 'user', 'content': '...'}, ...].
+        n (int): Number of responses to generate.
+        max_tokens (int, optional): Maximum number of tokens to generate per response. Default is 100.
+        cdisplay (bool, optional): If True, displays status messages during processing. Default is False.
+
+    Returns:
+        list: The `n` generated response contents.
+    """
+    if isinstance(convo, str):
+        convo = [{'role':'user', 'content':convo}]
+
+    if cdisplay:
+      print(f"{self.persona} thinking x{n}...")
+
+    messages = [*self.history_, *convo]
     output = self.client.chat.completions.create(
-        model = self.model,
-        messages = self.history_,
+        messages = messages,
+        max_tokens = max_tokens,
+        n = n,
+        **self._static_kwargs,
+    )
+    said = [choice.message.content for choice in output.choices[:n]]
+    # many OpenAI-compatible servers ignore `n` and return one choice; request the rest one at a time
+    for _ in range(n - len(said)):
+      output = self.client.chat.completions.create(
+          messages = messages,
+          max_tokens = max_tokens,
+          **self._static_kwargs,
+      )
+      said.append(output.choices[0].message.content)
+
+    if cdisplay:
+      print(f"{self.persona} finished thinking!")
+
+    return said
+
+
+  async def arespond_many(self, convo, n, max_tokens = 100, cdisplay = False):
+    """
+    Coroutine counterpart of `respond_many` for asynchronous LLM clients.
+    """
+    if isinstance(convo, str):
+        convo = [{'role':'user', 'content':convo}]
+
+    if cdisplay:
+      print(f"{self.persona} thinking x{n}...")
+
+    messages = [*self.history_, *convo]
+    output = await self._acreate(
+        messages = messages,
         max_tokens = max_tokens,
-        temperature = self.temperature,
-        seed = self.seed,
-        # top_p = self.rp
+        n = n,
+        **self._static_kwargs,
     )
-    agent_result = output.choices[0].message.content
+    said = [choice.message.content for choice in output.choices[:n]]
+    # top up servers that ignore `n`, with the missing requests in flight together
+    said.extend(await asyncio.gather(*(self._acomplete(messages, max_tokens) for _ in range(n - len(said)))))
 
-    if cdisplay == True:
+    if cdisplay:
       print(f"{self.persona} finished thinking!")
 
-    self.clear_history()
-    return agent_result
+    return said
+
+
+  def _cache_key(self, messages, max_tokens):
+    """
+    Returns the cache key for a request, or None when caching is disabled or the request is nondeterministic.
+    """
+    if self.cache is None:
+      return None
+    return self.cache.cache_key(self.model, messages, self.temperature, self.seed, max_tokens)
 
 
   def about(self):
@@ -102,14 +286,51 @@ class Persona:
     """
     Clears the conversation history, preserving only the initial system prompt.
     """
-    self.history_ = [{'role':'system', 'content':self.sys_prompt}]
-	
-	
+    del self.history_[1:]
+
+
 class MissingAttributeError(Exception):
     """Custom exception for missing required attributes."""
     pass
 
 
+_default_client = None
+_default_client_lock = threading.Lock()   # personas may make their first request from several threads at once
+
+def _shared_client():
+    """
+    Returns one process-wide OpenAI client, created on first use, whose pooled
+    keep-alive connections are reused by every persona that was not given a client.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            try:
+                import httpx
+                from openai import OpenAI
+            except ImportError as err:
+                raise ImportError("No `client` was provided and the default OpenAI client needs `openai` and `httpx`: "
+                                  "pip install personalityai[openai], or pass your own LLM client.") from err
+            _default_client = OpenAI(http_client = httpx.Client(limits = httpx.Limits(max_keepalive_connections = 16, max_connections = 32),
+                                                                timeout = 120))
+        return _default_client
+
+
+class _DefaultClient:
+    """
+    Stands in for the shared OpenAI client until the first request, so a Person can be created
+    without `openai`/`httpx` installed or an API key set. The default client is synchronous only.
+    """
+    __slots__ = ()
+
+    @property
+    def chat(self):
+        return _shared_client().chat
+
+
+_DEFAULT_CLIENT = _DefaultClient()
+
+
 # instantiating personas at person instantiation
 class Person(Persona):
     """
@@ -128,13 +349,17 @@ class Person(Persona):
       referee (Persona): The special Persona responsible for selecting a final answer.
       client: The LLM API client used by the personas.
       model (str): The name of the LLM model.
+      max_history (int): Number of most recent messages sent with the system prompt each turn (None sends all).
 
     Raises:
       MissingAttributeError: If required personas are not provided during initialization.
     """
-    
-    
-    def __init__(self, name, description, personas, client = '', model = '', history = []):
+
+    __slots__ = ('name', 'personas', 'thoughtbubble', 'referee', 'max_history', 'fuse_identical_prompts',
+                 '_personas_by_name', '_all_personas')
+
+    def __init__(self, name, description, personas, client = '', model = '', history = None, cache = None, max_history = None,
+                 fuse_identical_prompts = False):
         """
         Initializes a Person instance by setting up its personas and system prompt.
 
@@ -142,43 +367,82 @@ class Person(Persona):
             name (str): The name of the Person agent.
             description (str): The system prompt that defines this Person's bio.
             personas (list): A list of dictionaries defining each persona's attributes.
-            client: The default LLM client for personas.
+            client: The default LLM client for personas. Pass one client and let personas share it; if neither this nor a
+                persona dict provides one, a shared, connection-pooled OpenAI client is created on the first request.
+                That default client is synchronous, so the async methods need an asynchronous client.
             model (str): The default model name for all personas.
-            history (list, optional): Optional prior conversation history. Default is an empty list.
+            history (list, optional): Optional prior conversation history. Default is None (no prior history).
+            cache (LLMCache, optional): Default response cache for personas. Default is None (no caching).
+            max_history (int, optional): If set (to 1 or more), only the system prompt and the last `max_history`
+                messages are sent to the LLM on each turn; the full history is still kept. Default is None (send everything).
+            fuse_identical_prompts (bool, optional): If True, personas sharing a client, model, system prompt,
+                temperature and seed are answered by one request with `n` choices (extra requests are sent
+                if the server returns fewer). Default is False (one request per persona).
 
         Raises:
-            MissingAttributeError: If 'Referee' persona is missing or fewer than 3 personas are provided.
+            MissingAttributeError: If 'Referee' persona is missing or fewer than two other personas are provided.
+            ValueError: If `max_history` is neither None nor an integer of at least 1.
         """
-        import random
-        super().__init__(client, model)
+        # the window must keep at least the current user message
+        if max_history is not None and (isinstance(max_history, bool) or not isinstance(max_history, int) or max_history < 1):
+          raise ValueError(f"max_history must be None or an integer of at least 1, got {max_history!r}")
+
+        # the bio is the system prompt; Persona builds its system message and history once
+        super().__init__(client, model, function = description, cache = cache)
         self.name = name
-        self.sys_prompt = description
-        self.history_ = [{'role':'system', 'content':self.sys_prompt}] + history
+        if history is not None:
+          self.history_.extend(history)
+        self.max_history = max_history
+        self.fuse_identical_prompts = fuse_identical_prompts
         self.personas = []   # a list of dicts
         self.thoughtbubble = []
+        self._personas_by_name = {}   # lowercased persona name -> Persona, e.g. 'angel' for `person.angel`
         # self.model = model
         # self.client = client
 
-        # check for required personas
-        p_list = [p['persona'].lower() for p in personas]
-        if 'referee' not in p_list:
+        # check for required personas; lowercase each name once
+        lowered = [(persona, persona['persona'].lower()) for persona in personas]
+        if 'referee' not in {name for _, name in lowered}:
           raise MissingAttributeError(f"Missing required persona: 'Referee'")
-        elif len(p_list) < 3:
+        # the referee must have at least two non-referee personas to choose between
+        elif len(lowered) < 3 or sum(name != 'referee' for _, name in lowered) < 2:
           raise MissingAttributeError(f"Missing required attribute: 'Three (3) personas required: Referee and two others.'")
         else:
+          # fall back to one shared, connection-pooled client when no client is supplied; it is built on the first request
+          if not self.client and any('client' not in persona for persona in personas):
+            self.client = _DEFAULT_CLIENT
+
           # instantiate personas
-          for persona in personas:
-            setattr(self, persona['persona'].lower(), Persona(client = persona['client'] if 'client' in persona else self.client,
-                                                              model = persona['model'] if 'model' in persona else self.model,
-                                                              persona = persona['persona'],
-                                                              function = persona['function'],
-                                                              temp = persona['temperature'] if 'temperature' in persona else 0.5,
-                                                              seed = persona['seed'] if 'seed' in persona else random.random(),
-                                                              rp = persona['repeat_penalty'] if 'repeat_penalty' in persona else 1.1)
-            )
+          for persona, name in lowered:
+            persona_obj = Persona(client = persona.get('client', self.client),
+                                  model = persona.get('model', self.model),
+                                  persona = persona['persona'],
+                                  function = persona['function'],
+                                  temp = persona.get('temperature', 0.5),
+                                  seed = persona.get('seed'),
+                                  rp = persona.get('repeat_penalty', 1.1),
+                                  cache = persona.get('cache', self.cache))
+            self._personas_by_name[name] = persona_obj
             # exclude referee from persona list
-            if persona['persona'].lower() != "referee":
-              self.personas.append(getattr(self, persona['persona'].lower()))
+            if name != "referee":
+              self.personas.append(persona_obj)
+          self.referee = self._personas_by_name['referee']
+          # flat list of every persona, referee included, for whole-person resets
+          self._all_personas = [*self.personas, self.referee]
+
+    def __getattr__(self, name):
+        """
+        Looks up personas by their lowercased name, so `person.angel` keeps working.
+
+        Only called when normal attribute lookup fails. Private names are never resolved here, which keeps
+        copy/deepcopy (which probe attributes before the slots are filled) from recursing.
+        """
+        if not name.startswith('_'):
+          try:
+            return object.__getattribute__(self, '_personas_by_name')[name]
+          except (AttributeError, KeyError):
+            pass
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
 
     def think(self, prompt = '', cdisplay = False):
@@ -195,23 +459,110 @@ class Person(Persona):
         Returns:
             list: The list of responses from the personas.
         """
-        personas_said = []
-        if cdisplay==True:
-			print('thinking...')
+        personas_said = self._think(prompt, cdisplay = cdisplay)
+        self._collect_thoughts(personas_said, cdisplay = cdisplay)
+        return personas_said
 
-        for persona in self.personas:              # `persona` is a PersonaObject
-          response = persona.respond(prompt, cdisplay = cdisplay)
-          personas_said.append(response)
 
-          # append thoughts to thoughtbubble
-          if cdisplay:
-            print(f'collecting thoughts...')
-          self.thoughtbubble.append(f"{persona.persona}: {response}")
-          if cdisplay:
-            print('thought collection complete!')
+    def _think(self, prompt, cdisplay = False):
+        """
+        Runs `think` without touching the thoughtbubble, so `answer` can record the whole turn in one write.
+        """
+        if cdisplay:
+          print('thinking...')
+
+        # persona groups respond concurrently; each request is a blocking LLM call
+        groups = self._persona_groups()
+        with ThreadPoolExecutor(max_workers = len(groups) or 1) as executor:
+          submit = executor.submit
+          futures = [submit(self.personas[group[0]].respond_many, prompt, len(group), cdisplay = cdisplay) if len(group) > 1
+                     else submit(self.personas[group[0]].respond, prompt, cdisplay = cdisplay)
+                     for group in groups]
+          return self._ungroup(groups, [future.result() for future in futures])
+
+
+    async def athink(self, prompt = '', cdisplay = False):
+        """
+        Coroutine counterpart of `think` for asynchronous LLM clients (e.g., AsyncOpenAI).
+
+        All persona requests are in flight at once via `asyncio.gather`, and their
+        responses are collected in the `thoughtbubble` in persona order.
+
+        Args:
+            prompt (str or list): The user message or history to respond to.
+            cdisplay (bool, optional): If True, prints thought collection steps.
+
+        Returns:
+            list: The list of responses from the personas.
+        """
+        personas_said = await self._athink(prompt, cdisplay = cdisplay)
+        self._collect_thoughts(personas_said, cdisplay = cdisplay)
         return personas_said
 
 
+    async def _athink(self, prompt, cdisplay = False):
+        """
+        Coroutine counterpart of `_think`.
+        """
+        if cdisplay:
+          print('thinking...')
+
+        groups = self._persona_groups()
+        results = await asyncio.gather(*(self.personas[group[0]].arespond_many(prompt, len(group), cdisplay = cdisplay) if len(group) > 1
+                                         else self.personas[group[0]].arespond(prompt, cdisplay = cdisplay)
+                                         for group in groups))
+        return self._ungroup(groups, results)
+
+
+    def _persona_groups(self):
+        """
+        Groups persona indices whose requests would be identical apart from the persona's name,
+        so each group can be answered by one request with `n` choices.
+
+        Returns:
+            list: Lists of indices into `personas`; all singletons if `fuse_identical_prompts` is off.
+        """
+        if not self.fuse_identical_prompts:
+          return [[index] for index in range(len(self.personas))]
+        groups = {}
+        for index, persona in enumerate(self.personas):
+          key = (id(persona.client), persona.model, persona.sys_prompt, persona.temperature, persona.seed)
+          groups.setdefault(key, []).append(index)
+        return list(groups.values())
+
+
+    def _ungroup(self, groups, results):
+        """
+        Maps per-group results (a str for a singleton, a list for a fused group) back to persona order.
+        """
+        personas_said = [None] * len(self.personas)
+        for group, result in zip(groups, results):
+          if len(group) == 1:
+            personas_said[group[0]] = result
+          else:
+            for index, said in zip(group, result):
+              personas_said[index] = said
+        return personas_said
+
+
+    def _collect_thoughts(self, personas_said, cdisplay = False):
+        """
+        Appends each persona's response to the thoughtbubble, in persona order.
+        """
+        if cdisplay:
+          print(f'collecting thoughts...')
+        self.thoughtbubble.extend(self._thought_lines(personas_said))
+        if cdisplay:
+          print('thought collection complete!')
+
+
+    def _thought_lines(self, personas_said):
+        """
+        Returns the thoughtbubble lines for each persona's response, in persona order.
+        """
+        return (f"{persona.persona}: {response}" for persona, response in zip(self.personas, personas_said))
+
+
     def answer(self, prompt = '', bypass = False, choices = (), cdisplay = False):
         """
         Generates a final response by using personas to think and a referee to choose.
@@ -223,36 +574,135 @@ class Person(Persona):
             cdisplay (bool, optional): If True, prints status during generation.
 
         Returns:
-            str: The final answer chosen by the referee persona.
+            str: The final answer chosen by the referee persona, or '' if `prompt` is empty or whitespace.
         """
-        self.history_ += [{'role':'user', 'content':prompt}]
-        self.thoughtbubble.append(f"user: {prompt}")
+        # nothing to answer; skip the persona and referee LLM calls entirely
+        if not prompt or not prompt.strip():
+          return ''
+
+        self.history_.append({'role':'user', 'content':prompt})
+        # this turn's thoughtbubble lines, written in one go; also on failure, so the user turn
+        # is recorded in the thoughtbubble whenever it is in the history
+        thought = [f"user: {prompt}"]
+        try:
+          if cdisplay:
+            print('answering...')
+
+          context = self._context()
+
+          # generate responses based on internally generated anthropomorph response
+          if not bypass:
+            personas_said = self._think(context, cdisplay = cdisplay)
+            thought.extend(self._thought_lines(personas_said))
+          # generate responses based on externally provided anthropomorphs' responses
+          else:
+            personas_said = list(choices)
+
+          final_answer = self._choose(context, personas_said, cdisplay = cdisplay)
+          self.history_.append({'role':'assistant', 'content':final_answer})
+          thought.append(f"{self.name}: {final_answer}")
+        finally:
+          self.thoughtbubble.extend(thought)
 
         if cdisplay:
-          print('answering...')
+          print('answered!')
+        return final_answer
 
-        # generate responses based on internally generated anthropomorph response
-        if bypass == False:
-          personas_said = self.think(self.history_, cdisplay = cdisplay)
 
-          final_answer = self.referee.respond(self.history_ + [{'role':'system', 'content': f"""CHOOSE A RESPONSE:```{str(personas_said)}```."""}], cdisplay = cdisplay)
-          self.history_ += [{'role':'assistant', 'content':final_answer}]
-          self.thoughtbubble.append(f"{self.name}: {final_answer}")
+    async def aanswer(self, prompt = '', bypass = False, choices = (), cdisplay = False):
+        """
+        Coroutine counterpart of `answer` for asynchronous LLM clients (e.g., AsyncOpenAI).
 
-          if cdisplay:
-            print('answered!')
-          return final_answer
+        Lets callers run several conversations concurrently without threads. A Person is not
+        coroutine-safe: concurrent calls on one instance interleave its history and thoughtbubble,
+        so use a separate Person per concurrent conversation.
 
-        # generate responses based on externally provided anthropomorphs' responses
-        elif bypass == True:
-          personas_said = list(choices)
-          final_answer = self.referee.respond(self.history_ + [{'role':'system', 'content': f"""CHOOSE A RESPONSE:```{str(personas_said)}```."""}], cdisplay = cdisplay)
-          self.history_ += [{'role':'assistant', 'content':final_answer}]
-          self.thoughtbubble.append(f"{self.name}: {final_answer}")
+        Args:
+            prompt (str): The user's message.
+            bypass (bool, optional): If True, uses external `choices` instead of running `athink`. Default is False.
+            choices (tuple, optional): Pre-provided responses to use if `bypass` is True.
+            cdisplay (bool, optional): If True, prints status during generation.
 
+        Returns:
+            str: The final answer chosen by the referee persona, or '' if `prompt` is empty or whitespace.
+        """
+        if not prompt or not prompt.strip():
+          return ''
+
+        self.history_.append({'role':'user', 'content':prompt})
+        thought = [f"user: {prompt}"]
+        try:
           if cdisplay:
-            print('answered!')
-          return final_answer
+            print('answering...')
+
+          context = self._context()
+          if not bypass:
+            personas_said = await self._athink(context, cdisplay = cdisplay)
+            thought.extend(self._thought_lines(personas_said))
+          else:
+            personas_said = list(choices)
+
+          final_answer = await self._achoose(context, personas_said, cdisplay = cdisplay)
+          self.history_.append({'role':'assistant', 'content':final_answer})
+          thought.append(f"{self.name}: {final_answer}")
+        finally:
+          self.thoughtbubble.extend(thought)
+
+        if cdisplay:
+          print('answered!')
+        return final_answer
+
+
+    def _choose(self, context, personas_said, cdisplay = False):
+        """
+        Has the referee pick one of `personas_said` given the conversation `context`.
+
+        A single choice is returned as-is, saving the referee's LLM call. The referee is only
+        asked once every persona has answered: its prompt lists all choices, so a call started
+        on a partial set would have to be discarded and re-sent whenever another persona finishes.
+        """
+        if len(personas_said) == 1:
+          return personas_said[0]
+
+        # referee sees the context plus a trailing choice prompt; pushed and popped to avoid copying history
+        context.append(self._choice_prompt(personas_said))
+        try:
+          return self.referee.respond(context, cdisplay = cdisplay)
+        finally:
+          context.pop()
+
+
+    async def _achoose(self, context, personas_said, cdisplay = False):
+        """
+        Coroutine counterpart of `_choose`.
+        """
+        if len(personas_said) == 1:
+          return personas_said[0]
+
+        context.append(self._choice_prompt(personas_said))
+        try:
+          return await self.referee.arespond(context, cdisplay = cdisplay)
+        finally:
+          context.pop()
+
+
+    def _choice_prompt(self, personas_said):
+        """
+        Builds the referee's trailing system message listing `personas_said`.
+        """
+        # JSON gives a stable, unambiguous encoding of the choices across runs and Python versions
+        payload = json.dumps(personas_said, ensure_ascii = False, default = str)
+        return {'role':'system', 'content': _REF_PREFIX + payload + _REF_SUFFIX}
+
+
+    def _context(self):
+        """
+        Returns the messages sent to personas this turn: the history itself, or the system
+        prompt plus the last `max_history` messages when the history is longer than that.
+        """
+        if self.max_history is None or len(self.history_) <= self.max_history + 1:
+          return self.history_
+        return [self.history_[0], *self.history_[-self.max_history:]]
 
 
     def thoughts(self):
@@ -262,45 +712,52 @@ class Person(Persona):
         Returns:
             str: Formatted string of user and persona thoughts.
         """
-        thoughts = ''
+        parts = []
 
-        if self.thoughtbubble == []:
+        if not self.thoughtbubble:
           print(f"{self.name} has no thoughts yet.")
           return
 
         else:
           for index, event in enumerate(self.thoughtbubble):
-            if (index > 0) and (event.split(':')[0]=='user'):
-              thoughts += '\n' + event + '\n'
-            else:
-              thoughts += event + '\n'
+            if (index > 0) and event.startswith('user:'):
+              parts.append('')   # blank line before each new user turn
+            parts.append(event)
+          parts.append('')       # trailing newline
 
-          return thoughts
+          return '\n'.join(parts)
 
 
     def clear_history(self):
         """
         Clears the entire conversation history and internal persona histories.
         """
-        self.history_ = [{'role':'system', 'content':self.sys_prompt}]
-        self.thoughtbubble = []
-        self.referee.clear_history()
-        for persona in self.personas:
-          persona.clear_history()
-
+        self._reset_fast()
         print(f"Chat history with {self.name} cleared!")
 
 
+    def _reset_fast(self):
+        """
+        Silently resets the history to its system prompt and empties the thoughtbubble, reusing both lists.
+        """
+        del self.history_[1:]
+        self.thoughtbubble.clear()
+        for persona in self._all_personas:
+          persona.clear_history()
+
+
     def history(self):
         """
         Prints the conversation history with the assistant's name.
         """
         if len(self.history_) > 1:
-          for item in self.history_[1:]:
+          lines = []
+          for item in islice(self.history_, 1, None):   # skip the system prompt without copying the history
             if item['role'] == 'assistant':
-              print(f"{self.name}: {item['content']}\n")
+              lines.append(f"{self.name}: {item['content']}\n")
             else:
-              print(f"{item['role']}: {item['content']}\n")
+              lines.append(f"{item['role']}: {item['content']}\n")
+          print('\n'.join(lines))   # one write instead of a print per message
         else:
           print(f"No chat history with {self.name} yet.")
           pass
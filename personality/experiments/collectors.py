@@ -1,11 +1,33 @@
-import random # Needed for random.random() if used implicitly or for reproducibility tests
+import re
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from personality import Person
 from personality import Persona # Although Person imports Persona, explicit import can be useful if these functions ever directly interact with Persona objects.
 
+# matches `Person.thoughts()` lines of user prompts and anthropomorph responses
+_LINE_RE = re.compile(r'^(?P<who>Angel|Devil|user): (?P<msg>.*)$', re.MULTILINE)
+_USER_RE = re.compile(r'^user: (.*)$', re.MULTILINE)
+
 class MissingAttributeError(Exception):
     """Custom exception for missing required attributes."""
     pass
 
+def _parse_thoughts(thoughts: str):
+    """
+    Splits a `Person.thoughts()` string into user prompts and anthropomorph responses in a single pass.
+    Returns a `tuple` of three `lists` of `str`: `(user_prompts, angelic_responses, devilish_responses)`,
+    all empty if `thoughts` is empty or None (e.g. `Person.thoughts()` when every prompt was blank).
+    """
+    user_prompt_list, angelic_responses, devilish_responses = [], [], []
+    if not thoughts:
+        return user_prompt_list, angelic_responses, devilish_responses
+    # `_LINE_RE` only matches these three speakers, so every match has a handler
+    dispatch = {'Angel': angelic_responses.append, 'Devil': devilish_responses.append, 'user': user_prompt_list.append}
+
+    for who, msg in _LINE_RE.findall(thoughts):
+        dispatch[who](msg.strip()) # .strip() to remove leading/trailing whitespace
+    return user_prompt_list, angelic_responses, devilish_responses
+
 def response_collector(prompts: list, person: Person, collect: [str, list] = "anthro", chat_history: str = '', persist: bool = False):
     """
     Function for collecting anthropomorphic agents' responses.
@@ -26,10 +48,6 @@ def response_collector(prompts: list, person: Person, collect: [str, list] = "an
     `persist`: `bool`; True to enable Person object maintain history of conversation. Used with `prompts` and `person`.
     """
 
-    angelic_responses = []
-    devilish_responses = []
-    user_prompt_list = [] # Renamed to avoid conflict with function parameter `user_prompt` in ref_response_collector
-
     ### use user defined prompts to generate responses if no chat history is provided
     if not chat_history: # Checks if chat_history is empty string
         if not prompts or not isinstance(prompts, list):
@@ -44,22 +62,15 @@ def response_collector(prompts: list, person: Person, collect: [str, list] = "an
             person.answer(prompt)
 
         ### collect each anthropomorph's responses
-        responses = person.thoughts().split('\n')
-
-        for item in responses:
-            if item.startswith('Angel'):
-                angelic_responses.append(item.split('Angel: ')[1].strip()) # .strip() to remove leading/trailing whitespace
-            elif item.startswith('Devil'): # Use elif to ensure an item is only processed once
-                devilish_responses.append(item.split('Devil: ')[1].strip())
+        _, angelic_responses, devilish_responses = _parse_thoughts(person.thoughts())
 
         ### clear_history and restore original temperature if `persist` is set to False
         if not persist:
             person.clear_history()
             person.referee.temperature = org_temp     # restore originally set temperature
 
-        # Ensure lists are of equal length before zipping, handle potential mismatches gracefully
-        min_len = min(len(angelic_responses), len(devilish_responses))
-        return list(zip(angelic_responses[:min_len], devilish_responses[:min_len]))
+        # zip stops at the shorter list, so mismatched response counts are handled gracefully
+        return list(zip(angelic_responses, devilish_responses))
 
     ### extract responses if chat_history is provided
     elif isinstance(chat_history, str) and len(chat_history) > 0:
@@ -72,44 +83,68 @@ def response_collector(prompts: list, person: Person, collect: [str, list] = "an
                 raise ValueError("`collect` list must contain exactly 'anthro' and 'user'.")
             else:
                 ### collect both user prompts and anthropomorph responses from chat_history
-                for item in chat_history.split('\n'):
-                    if item.startswith('Angel:'):
-                        angelic_responses.append(item.split('Angel: ')[1].strip())
-                    elif item.startswith('Devil:'):
-                        devilish_responses.append(item.split('Devil: ')[1].strip())
-                    elif item.startswith('user:'):
-                        user_prompt_list.append(item.split('user: ')[1].strip())
-                min_len = min(len(angelic_responses), len(devilish_responses))
-                return user_prompt_list, list(zip(angelic_responses[:min_len], devilish_responses[:min_len]))
+                user_prompt_list, angelic_responses, devilish_responses = _parse_thoughts(chat_history)
+                return user_prompt_list, list(zip(angelic_responses, devilish_responses))
 
         elif isinstance(collect, str):
             ### collect only anthropomorphs responses from chat_history
             if collect == "anthro":
-                for item in chat_history.split('\n'):
-                    if item.startswith('Angel:'):
-                        angelic_responses.append(item.split('Angel: ')[1].strip())
-                    elif item.startswith('Devil:'):
-                        devilish_responses.append(item.split('Devil: ')[1].strip())
-                min_len = min(len(angelic_responses), len(devilish_responses))
-                return list(zip(angelic_responses[:min_len], devilish_responses[:min_len]))
+                _, angelic_responses, devilish_responses = _parse_thoughts(chat_history)
+                return list(zip(angelic_responses, devilish_responses))
 
             ### collect only user prompts from chat_history
             elif collect == "user":
-                for item in chat_history.split('\n'):
-                    if item.startswith('user:'):
-                        user_prompt_list.append(item.split('user: ')[1].strip())
-                return user_prompt_list
+                return [match.group(1).strip() for match in _USER_RE.finditer(chat_history)]
             else:
                 raise ValueError("`collect` string must be 'anthro' or 'user'.")
     else:
         raise TypeError("`chat_history` must be a non-empty `str` when provided.")
 
 
+def _clone_person(person: Person):
+    """
+    Deep-copies `person`, its personas and their histories, but shares the LLM clients and
+    response caches, which hold connection pools and locks that must not be copied.
+    """
+    memo = {}
+    for p in (person, person.referee, *person.personas):
+        memo[id(p.client)] = p.client
+        memo[id(p.cache)] = p.cache
+    return copy.deepcopy(person, memo)
+
+def _ref_level_responses(person: Person, user_prompt: list, choices: list, temperature: float, printout: bool, bypass: bool, cdisplay: bool):
+    """
+    Answers each prompt in `user_prompt` with the `referee` of `person` set to `temperature`.
+    Returns a `tuple` of the `list` of referee responses and the `list` of status and printout lines,
+    which the caller prints so concurrent levels do not interleave.
+    """
+    person.referee.temperature = temperature
+    current_lvl_responses = [None] * len(user_prompt) # Store responses for the current temperature level
+    printed = []
+
+    answer = person.answer
+    for index, prompt in enumerate(user_prompt):
+        if bypass:
+            # Capture the answer to store it
+            ans = answer(prompt=prompt, bypass=bypass, choices=choices[index], cdisplay=cdisplay)
+            if printout:
+                printed += [f"user: {prompt}", f"Angel: {choices[index][0]}", f"Devil: {choices[index][1]}", f"{person.name}: {ans}"]
+        else: # generate responses internally
+            printed.append(f'prompting...: {index} with "{prompt}"')
+            # Capture the answer to store it
+            ans = answer(prompt=prompt, bypass=bypass, cdisplay=cdisplay)
+        current_lvl_responses[index] = ans # Store the answer at its prompt's position
+
+    return current_lvl_responses, printed
+
 def ref_response_collector(person: Person, user_prompt: list, choices: list, temp: dict = None, rp: dict = None, printout: bool = False, chat_history: dict = None, bypass: bool = False, cdisplay: bool = False):
     """
     Function for collecting responses of `referee` `Persona` object of a `Person` instance at different temperatures.
     Iterates over `temp` (or `rp`), which is a `dict` containing various `float` temperatures (or repeat penalties).
     Returns a `dict` of `lists` of responses at each defined temperature/rp. E.g.: `{'lo': ["x", "y"], 'hi': ["v", "w"]}`.
+    Temperature levels are generated concurrently, each on its own copy of `person`; `person` itself is only cleared.
+    Each level's status and printout lines are printed together, in level order, once the level is done;
+    `cdisplay` output is printed as it happens and may interleave between levels.
 
     N/B: `user_prompt` and `choices` must be same length when provided.
 
@@ -135,83 +170,46 @@ def ref_response_collector(person: Person, user_prompt: list, choices: list, tem
         chat_history = {}
 
     ### collect `Person` object name if chat_history is provided
-    agent_name = list(chat_history.keys())[0] if chat_history else None
+    agent_name = next(iter(chat_history), None)
 
     ### if no chat_history, generate referee responses with user_prompt and choices provided
     if not chat_history:
         if not user_prompt or not choices or len(user_prompt) != len(choices):
             raise ValueError("`user_prompt` and `choices` must be non-empty lists of the same length when `chat_history` is not provided.")
 
-        person.clear_history()
+        person._reset_fast()
         ref_collector = temp.copy() # Use temp if available, otherwise rp.copy()
-        org_temp = person.referee.temperature
-        # org_rp = person.referee.rp # uncomment if rp is actively used
-
-        ### generate referee responses for each temperature level
-        for lvl in ref_collector:
-            person.referee.temperature = ref_collector[lvl]
-            # person.referee.rp = ref_collector[lvl] # uncomment if rp is actively used
-
-            print(f'Generating responses for Referee at temperature of {person.referee.temperature}...')
-
-            current_lvl_responses = [] # Store responses for the current temperature level
-
-            for index, prompt in enumerate(user_prompt):
-                if printout and bypass:
-                    print(f"user: {prompt}")
-                    print(f"Angel: {choices[index][0]}")
-                    print(f"Devil: {choices[index][1]}")
-                    # Capture the answer to store it
-                    ans = person.answer(prompt=prompt, bypass=bypass, choices=choices[index], cdisplay=cdisplay)
-                    print(f"{person.name}: {ans}")
-                    current_lvl_responses.append(ans) # Add the answer to the list
-                elif not printout and bypass:
-                    # Capture the answer to store it
-                    ans = person.answer(prompt=prompt, bypass=bypass, choices=choices[index], cdisplay=cdisplay)
-                    current_lvl_responses.append(ans) # Add the answer to the list
-                elif not bypass: # generate responses internally
-                    print(f'prompting...: {index} with "{prompt}"')
-                    # Capture the answer to store it
-                    ans = person.answer(prompt=prompt, bypass=bypass, cdisplay=cdisplay)
-                    current_lvl_responses.append(ans) # Add the answer to the list
-
-            # Collect and store generated referee responses
-            if cdisplay:
-                print('collecting final responses for this temperature level...')
-
-            # The current_lvl_responses already contains the direct answers from person.answer()
-            # No need to parse person.thoughts() if we directly captured the answer from person.answer()
-            # However, if Person.answer() internally clears history before returning,
-            # we might need person.thoughts() right after each call if we want all internal thoughts.
-            # Assuming person.answer() returns the final answer directly as implemented in Person.py,
-            # we can just use the captured `ans` for `final_responses`.
-
-            # If the intent is to capture the *referee's* specific output from `person.thoughts()`
-            # after all prompts for a given temp level:
-            # responses_from_thoughts = person.thoughts().split('\n')
-            # final_responses_parsed = []
-            # for item in responses_from_thoughts:
-            #     if item.startswith(person.name):
-            #         final_responses_parsed.append(item.split(f'{person.name}: ')[1].strip())
-            # ref_collector[lvl] = final_responses_parsed
-            # Simpler: if `person.answer` returns the final referee answer, use `current_lvl_responses` directly.
-            ref_collector[lvl] = current_lvl_responses
-
-
-            person.clear_history() # Clear history for the next temperature level
-            if cdisplay:
-                print('final responses collected for this temperature level!')
-
-        person.referee.temperature = org_temp
-        # person.referee.rp = org_rp # uncomment if rp is actively used
+
+        ### generate referee responses for all temperature levels concurrently, each on its own copy of `person`
+        with ThreadPoolExecutor(max_workers=len(ref_collector) or 1) as executor:
+            futures = {}
+            for lvl in ref_collector:
+                futures[lvl] = executor.submit(_ref_level_responses, _clone_person(person), user_prompt, choices,
+                                               ref_collector[lvl], printout, bypass, cdisplay)
+                # rp levels would be passed here instead of temperatures if rp is actively used
+
+            # Collect and store generated referee responses; each level's printout is kept together
+            for lvl, future in futures.items():
+                level_temp = ref_collector[lvl]
+                if cdisplay:
+                    print('collecting final responses for this temperature level...')
+                ref_collector[lvl], printed = future.result()
+                print(f'Generating responses for Referee at temperature of {level_temp}...')
+                if printed:
+                    print('\n'.join(printed))
+                if cdisplay:
+                    print('final responses collected for this temperature level!')
+
         return ref_collector
 
     ### if chat_history is provided, collect referee responses from provided chat history
     elif agent_name and isinstance(chat_history.get(agent_name), str):
         referee_responses = []
+        referee_append = referee_responses.append
         for item in chat_history[agent_name].split('\n'):
-            if item.startswith(f'{agent_name}:'):
-                referee_responses.append(item.split(f'{agent_name}: ')[1].strip())
+            who, sep, msg = item.partition(': ')   # one scan finds the speaker and the message
+            if sep and who == agent_name:
+                referee_append(msg.strip())
         return referee_responses
     else:
         raise TypeError("`chat_history` must be a `dict` with the `Person` object's name as a key and a `str` containing thoughts as its value.")
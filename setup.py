@@ -5,4 +5,5 @@ setup(name = "personalityai",
 	description = "A Python package for creating AI personalities with multiple personas.",
 	author = "Ime Inyang",
 	author_email = "alfiinyang@gmail.com",
-	packages = ['personality','personality.experiments'])
\ No newline at end of file
+	packages = ['personality','personality.experiments'],
+	extras_require = {'openai': ['openai', 'httpx']})
\ No newline at end of file